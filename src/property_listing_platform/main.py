@@ -89,6 +89,48 @@ async def search_properties(
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Error during search: {str(e)}")
 
+@app.get("/api/v1/stats/prices")
+async def get_price_statistics(
+    location: str,
+    property_type: str,
+    quantiles: List[float] = Query([0.1, 0.5, 0.9], description="Quantiles between 0 and 1")
+):
+    """
+    Price statistics of available properties in a market:
+    - Count
+    - Mean price
+    - Requested quantiles (defaults to p10 / median / p90)
+    """
+    global property_manager
+
+    if not property_manager:
+        raise HTTPException(status_code=500, detail="Property manager not initialized")
+
+    try:
+        stats = property_manager.get_price_statistics(location, property_type, quantiles)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return {"location": location, "property_type": property_type, **stats}
+
+@app.get("/api/v1/suggest")
+async def suggest(
+    prefix: str = "",
+    limit: int = Query(5, ge=1, le=10, description="Number of suggestions per category")
+):
+    """
+    Autocomplete for the search box:
+    - Locations matching the prefix
+    - Property types matching the prefix
+    - Ranked by number of available listings
+    """
+    global property_manager
+
+    if not property_manager:
+        raise HTTPException(status_code=500, detail="Property manager not initialized")
+
+    return {"prefix": prefix, **property_manager.suggest(prefix, limit)}
+
 
 # App initialization
 @app.on_event("startup")
@@ -0,0 +1,146 @@
+import math
+import random
+from typing import Optional
+
+
+class _SkipNode:
+    __slots__ = ("value", "next", "width")
+
+    def __init__(self, value: float, levels: int):
+        self.value = value
+        self.next = [None] * levels
+        self.width = [1] * levels
+
+
+class IndexedSkipList:
+    MAX_LEVELS = 32
+
+    def __init__(self):
+        """
+        Initialize an indexable skip list:
+        - Sorted storage of values (duplicates allowed)
+        - Link widths for O(log n) rank lookups
+        """
+        self.size = 0
+        self._tail = _SkipNode(float("inf"), 0)
+        self._head = _SkipNode(float("-inf"), self.MAX_LEVELS)
+        self._head.next = [self._tail] * self.MAX_LEVELS
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index: int) -> float:
+        """Return the value at the given rank (0-based) in sorted order."""
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("skip list index out of range")
+
+        node = self._head
+        steps = index + 1
+        for level in reversed(range(self.MAX_LEVELS)):
+            while node.width[level] <= steps:
+                steps -= node.width[level]
+                node = node.next[level]
+        return node.value
+
+    def insert(self, value: float):
+        """Insert a value, keeping the list sorted."""
+        chain = [None] * self.MAX_LEVELS
+        steps_at_level = [0] * self.MAX_LEVELS
+        node = self._head
+        for level in reversed(range(self.MAX_LEVELS)):
+            while node.next[level].value <= value:
+                steps_at_level[level] += node.width[level]
+                node = node.next[level]
+            chain[level] = node
+
+        # Geometric level distribution with p = 1/2
+        levels = min(self.MAX_LEVELS, 1 - int(math.log(1.0 - random.random(), 2.0)))
+        new_node = _SkipNode(value, levels)
+        steps = 0
+        for level in range(levels):
+            prev_node = chain[level]
+            new_node.next[level] = prev_node.next[level]
+            prev_node.next[level] = new_node
+            new_node.width[level] = prev_node.width[level] - steps
+            prev_node.width[level] = steps + 1
+            steps += steps_at_level[level]
+        for level in range(levels, self.MAX_LEVELS):
+            chain[level].width[level] += 1
+
+        self.size += 1
+
+    def remove(self, value: float):
+        """Remove one occurrence of a value. Raises ValueError if absent."""
+        chain = [None] * self.MAX_LEVELS
+        node = self._head
+        for level in reversed(range(self.MAX_LEVELS)):
+            while node.next[level].value < value:
+                node = node.next[level]
+            chain[level] = node
+
+        target = chain[0].next[0]
+        if target is self._tail or target.value != value:
+            raise ValueError(f"{value} not in skip list")
+
+        levels = len(target.next)
+        for level in range(levels):
+            prev_node = chain[level]
+            prev_node.width[level] += target.width[level] - 1
+            prev_node.next[level] = target.next[level]
+        for level in range(levels, self.MAX_LEVELS):
+            chain[level].width[level] -= 1
+
+        self.size -= 1
+
+
+class PriceStatistics:
+    def __init__(self):
+        """
+        Initialize price statistics for a single market:
+        - Order-statistic index over prices
+        - Running total for the mean
+        """
+        self.prices = IndexedSkipList()
+        self.total = 0.0
+
+    @property
+    def count(self) -> int:
+        return len(self.prices)
+
+    def add(self, price: float):
+        """Record the price of a listing that became available."""
+        self.prices.insert(price)
+        self.total += price
+
+    def remove(self, price: float):
+        """Drop the price of a listing that is no longer available."""
+        self.prices.remove(price)
+        self.total -= price
+
+    def mean(self) -> Optional[float]:
+        """Mean price, or None if the market has no listings."""
+        if not self.count:
+            return None
+        return self.total / self.count
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Price at quantile q (0 <= q <= 1):
+        - Linear interpolation between neighbouring ranks
+        - None if the market has no listings
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile must be between 0 and 1")
+        if not self.count:
+            return None
+
+        position = q * (self.count - 1)
+        lower = math.floor(position)
+        upper = math.ceil(position)
+        lower_price = self.prices[lower]
+        if lower == upper:
+            return lower_price
+        upper_price = self.prices[upper]
+        return lower_price + (upper_price - lower_price) * (position - lower)
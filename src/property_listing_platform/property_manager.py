@@ -1,5 +1,7 @@
 import uuid
 from datetime import datetime
+from property_listing_platform.price_stats import PriceStatistics
+from property_listing_platform.suggest import SuggestionTrie
 
 class Property:
     def __init__(self, property_id: str, user_id: str, details: dict):
@@ -37,6 +39,9 @@ class PropertyManager:
         self.price_index = []  # Sorted list of (price, property_id)
         self.location_index = {}  # Maps location to list of property_ids
         self.status_index = {"available": set(), "sold": set()}  # Status-based index
+        self.price_stats = {}  # Maps (location, property_type) to PriceStatistics of available listings
+        self.location_suggestions = SuggestionTrie()  # Prefix trie over locations, ranked by available count
+        self.type_suggestions = SuggestionTrie()  # Prefix trie over property types, ranked by available count
 
     def add_property(self, user_id: str, property_details: dict) -> str:
         """
@@ -67,6 +72,8 @@ class PropertyManager:
             self.location_index[location] = []
         self.location_index[location].append(property_id)
         self.status_index["available"].add(property_id)
+        self._get_market_stats(property_details).add(property_details["price"])
+        self._update_suggestions(property_details, 1)
 
         return property_id
 
@@ -95,8 +102,62 @@ class PropertyManager:
         self.status_index[old_status].remove(property_id)
         self.status_index[status].add(property_id)
 
+        # Keep market price statistics and suggestions limited to available listings
+        if old_status != status:
+            price = property_obj.details["price"]
+            if old_status == "available":
+                self._get_market_stats(property_obj.details).remove(price)
+                self._update_suggestions(property_obj.details, -1)
+            elif status == "available":
+                self._get_market_stats(property_obj.details).add(price)
+                self._update_suggestions(property_obj.details, 1)
+
         return True
 
+    def _get_market_stats(self, details: dict) -> PriceStatistics:
+        """Get (or create) the price statistics for a listing's market."""
+        market = (details["location"], details.get("property_type"))
+        if market not in self.price_stats:
+            self.price_stats[market] = PriceStatistics()
+        return self.price_stats[market]
+
+    def _update_suggestions(self, details: dict, delta: int):
+        """Adjust the available-listing counts behind prefix suggestions."""
+        self.location_suggestions.update(details["location"], delta)
+        if details.get("property_type"):
+            self.type_suggestions.update(details["property_type"], delta)
+
+    def suggest(self, prefix: str, limit: int = 10) -> dict:
+        """
+        Prefix suggestions for the search box:
+        - Locations and property types starting with prefix (case-insensitive)
+        - Ranked by number of available listings
+        """
+        return {
+            "locations": [
+                {"value": term, "available": count}
+                for term, count in self.location_suggestions.suggest(prefix, limit)
+            ],
+            "property_types": [
+                {"value": term, "available": count}
+                for term, count in self.type_suggestions.suggest(prefix, limit)
+            ],
+        }
+
+    def get_price_statistics(self, location: str, property_type: str, quantiles: list[float]) -> dict:
+        """
+        Price statistics of available listings in a market:
+        - Count and mean
+        - Requested quantiles (0 <= q <= 1)
+        Each quantile is O(log n) in the market size.
+        """
+        stats = self.price_stats.get((location, property_type), PriceStatistics())
+        return {
+            "count": stats.count,
+            "mean": stats.mean(),
+            "quantiles": {str(q): stats.quantile(q) for q in quantiles},
+        }
+
     def get_user_properties(self, user_id: str) -> list[Property]:
         """
         Retrieve all properties for a user:
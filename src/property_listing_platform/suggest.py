@@ -0,0 +1,92 @@
+import heapq
+from typing import Optional
+
+
+class _TrieNode:
+    __slots__ = ("label", "children", "counts", "top")
+
+    def __init__(self, label: str = ""):
+        self.label = label  # Edge label leading into this node
+        self.children = {}  # Maps first character of child label to child node
+        self.counts = {}  # Maps terms ending at this node to their listing count
+        self.top = []  # Cached top-k (term, count) completions below this node
+
+
+class SuggestionTrie:
+    def __init__(self, top_k: int = 10):
+        """
+        Initialize a compressed (radix) trie for prefix suggestions:
+        - Case-insensitive matching on term prefixes
+        - Per-term available-listing counts
+        - Cached top-k completions per node
+        """
+        self.top_k = top_k
+        self.root = _TrieNode()
+
+    def update(self, term: str, delta: int):
+        """
+        Adjust the listing count of a term:
+        - Insert the term (splitting edges as needed)
+        - Refresh cached completions along its path
+        """
+        key = term.casefold()
+        node = self.root
+        path = [node]
+
+        while key:
+            child = node.children.get(key[0])
+            if child is None:
+                child = _TrieNode(key)
+                node.children[key[0]] = child
+                key = ""
+            else:
+                common = 0
+                limit = min(len(child.label), len(key))
+                while common < limit and child.label[common] == key[common]:
+                    common += 1
+                if common < len(child.label):
+                    # Split the edge at the point of divergence
+                    middle = _TrieNode(child.label[:common])
+                    child.label = child.label[common:]
+                    middle.children[child.label[0]] = child
+                    middle.top = list(child.top)
+                    node.children[key[0]] = middle
+                    child = middle
+                key = key[common:]
+            node = child
+            path.append(node)
+
+        count = node.counts.get(term, 0) + delta
+        if count > 0:
+            node.counts[term] = count
+        else:
+            node.counts.pop(term, None)
+
+        for node in reversed(path):
+            candidates = list(node.counts.items())
+            for child in node.children.values():
+                candidates.extend(child.top)
+            node.top = heapq.nsmallest(self.top_k, candidates, key=lambda item: (-item[1], item[0]))
+
+    def suggest(self, prefix: str, limit: Optional[int] = None) -> list[tuple[str, int]]:
+        """
+        Top completions for a prefix:
+        - Ranked by listing count, then alphabetically
+        - Served from the cached top-k (no subtree scan)
+        """
+        key = prefix.casefold()
+        node = self.root
+
+        while key:
+            child = node.children.get(key[0])
+            if child is None:
+                return []
+            if child.label.startswith(key):
+                node = child
+                break
+            if not key.startswith(child.label):
+                return []
+            key = key[len(child.label):]
+            node = child
+
+        return node.top[:limit]
@@ -101,3 +101,41 @@ def test_search_properties_invalid_pagination():
     response = client.get("/api/v1/properties/search", params=params)
     assert response.status_code == 422  # Validation error
     assert "Input should be greater than or equal to 1" in response.text
+
+
+def test_price_statistics_success():
+    """
+    Test the /api/v1/stats/prices endpoint for a market with listings.
+    """
+    client.post("/api/v1/properties", json={**property_data, "location": "Austin", "price": 100000.0})
+    client.post("/api/v1/properties", json={**property_data, "location": "Austin", "price": 300000.0})
+
+    params = {"location": "Austin", "property_type": "apartment", "quantiles": [0.5, 0.9]}
+    response = client.get("/api/v1/stats/prices", params=params)
+    assert response.status_code == 200
+    response_data = response.json()
+    assert response_data["count"] == 2
+    assert response_data["mean"] == 200000
+    assert response_data["quantiles"]["0.5"] == 200000
+
+
+def test_price_statistics_invalid_quantile():
+    """
+    Test the /api/v1/stats/prices endpoint with a quantile outside [0, 1].
+    """
+    params = {"location": "Austin", "property_type": "apartment", "quantiles": [1.5]}
+    response = client.get("/api/v1/stats/prices", params=params)
+    assert response.status_code == 400
+
+
+def test_suggest_success():
+    """
+    Test the /api/v1/suggest endpoint for location prefixes.
+    """
+    client.post("/api/v1/properties", json={**property_data, "location": "Boulder"})
+
+    response = client.get("/api/v1/suggest", params={"prefix": "bou"})
+    assert response.status_code == 200
+    response_data = response.json()
+    assert response_data["locations"][0]["value"] == "Boulder"
+    assert response_data["property_types"] == []
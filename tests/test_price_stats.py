@@ -0,0 +1,61 @@
+import random
+
+import pytest
+from property_listing_platform.price_stats import IndexedSkipList, PriceStatistics
+
+
+def test_skip_list_matches_sorted_list():
+    """Test that ranks stay consistent with a sorted list through inserts and removes."""
+    rng = random.Random(42)
+    skip_list = IndexedSkipList()
+    reference = []
+
+    for _ in range(500):
+        value = rng.randint(0, 50)
+        skip_list.insert(value)
+        reference.append(value)
+    for value in reference[::3]:
+        skip_list.remove(value)
+    for value in reference[::3]:
+        reference.remove(value)
+
+    reference.sort()
+    assert len(skip_list) == len(reference)
+    assert [skip_list[i] for i in range(len(reference))] == reference
+    assert skip_list[-1] == reference[-1]
+
+
+def test_skip_list_remove_missing_value():
+    """Test removing a value that is not stored."""
+    skip_list = IndexedSkipList()
+    skip_list.insert(10)
+    with pytest.raises(ValueError):
+        skip_list.remove(20)
+    with pytest.raises(IndexError):
+        skip_list[1]
+
+
+def test_price_statistics_quantiles():
+    """Test count, mean and interpolated quantiles."""
+    stats = PriceStatistics()
+    for price in [400, 100, 300, 200]:
+        stats.add(price)
+
+    assert stats.count == 4
+    assert stats.mean() == 250
+    assert stats.quantile(0) == 100
+    assert stats.quantile(1) == 400
+    assert stats.quantile(0.5) == 250
+
+    stats.remove(400)
+    assert stats.quantile(0.5) == 200
+    assert stats.mean() == 200
+
+
+def test_price_statistics_empty_and_invalid():
+    """Test an empty market and out-of-range quantiles."""
+    stats = PriceStatistics()
+    assert stats.mean() is None
+    assert stats.quantile(0.5) is None
+    with pytest.raises(ValueError):
+        stats.quantile(1.5)
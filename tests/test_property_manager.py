@@ -98,3 +98,50 @@ def test_add_property_updates_indices(setup_manager):
 
     # Verify price index is sorted
     assert manager.price_index[0][0] == 500000
+
+
+def test_price_statistics_track_available_listings():
+    """Test that market price statistics follow adds and status transitions."""
+    manager = PropertyManager()
+    user_id = "user_123"
+    prices = [300000, 100000, 200000]
+    property_ids = [
+        manager.add_property(user_id, {"location": "San Francisco", "price": price, "property_type": "Apartment"})
+        for price in prices
+    ]
+    manager.add_property(user_id, {"location": "San Francisco", "price": 900000, "property_type": "House"})
+
+    stats = manager.get_price_statistics("San Francisco", "Apartment", [0.5])
+    assert stats == {"count": 3, "mean": 200000, "quantiles": {"0.5": 200000}}
+
+    # Sold listings drop out, relisted ones come back
+    manager.update_property_status(property_ids[0], "sold", user_id)
+    stats = manager.get_price_statistics("San Francisco", "Apartment", [0.5])
+    assert stats["count"] == 2
+    assert stats["quantiles"]["0.5"] == 150000
+
+    manager.update_property_status(property_ids[0], "available", user_id)
+    assert manager.get_price_statistics("San Francisco", "Apartment", [1])["quantiles"]["1"] == 300000
+
+    # Unknown market
+    stats = manager.get_price_statistics("Boston", "Apartment", [0.5])
+    assert stats == {"count": 0, "mean": None, "quantiles": {"0.5": None}}
+
+
+def test_suggest_tracks_available_listings():
+    """Test that prefix suggestions follow adds and status transitions."""
+    manager = PropertyManager()
+    user_id = "user_123"
+    property_id = manager.add_property(user_id, {"location": "San Jose", "price": 100000, "property_type": "Studio"})
+    manager.add_property(user_id, {"location": "San Francisco", "price": 200000, "property_type": "Apartment"})
+    manager.add_property(user_id, {"location": "San Francisco", "price": 300000, "property_type": "Apartment"})
+
+    suggestions = manager.suggest("san")
+    assert suggestions["locations"] == [
+        {"value": "San Francisco", "available": 2},
+        {"value": "San Jose", "available": 1},
+    ]
+    assert manager.suggest("st")["property_types"] == [{"value": "Studio", "available": 1}]
+
+    manager.update_property_status(property_id, "sold", user_id)
+    assert manager.suggest("san j")["locations"] == []
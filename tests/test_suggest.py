@@ -0,0 +1,39 @@
+from property_listing_platform.suggest import SuggestionTrie
+
+
+def test_suggest_ranks_by_count():
+    """Test that completions are ranked by count, then alphabetically."""
+    trie = SuggestionTrie()
+    for term, count in [("San Francisco", 3), ("San Diego", 5), ("Santa Monica", 3), ("Seattle", 1)]:
+        trie.update(term, count)
+
+    assert trie.suggest("san") == [("San Diego", 5), ("San Francisco", 3), ("Santa Monica", 3)]
+    assert trie.suggest("San ") == [("San Diego", 5), ("San Francisco", 3)]
+    assert trie.suggest("s", limit=1) == [("San Diego", 5)]
+    assert trie.suggest("") == trie.suggest("S")
+    assert trie.suggest("Boston") == []
+    assert trie.suggest("sanx") == []
+
+
+def test_suggest_term_that_is_prefix_of_another():
+    """Test edge splitting when one term is a prefix of another."""
+    trie = SuggestionTrie()
+    trie.update("Newark", 1)
+    trie.update("New", 2)
+    trie.update("New York", 4)
+
+    assert trie.suggest("new") == [("New York", 4), ("New", 2), ("Newark", 1)]
+    assert trie.suggest("newa") == [("Newark", 1)]
+
+
+def test_suggest_count_decrements():
+    """Test that terms drop out when their count falls to zero."""
+    trie = SuggestionTrie(top_k=2)
+    trie.update("Austin", 1)
+    trie.update("Atlanta", 2)
+    trie.update("Albany", 3)
+    assert trie.suggest("a") == [("Albany", 3), ("Atlanta", 2)]
+
+    trie.update("Albany", -3)
+    assert trie.suggest("a") == [("Atlanta", 2), ("Austin", 1)]
+    assert trie.suggest("al") == []